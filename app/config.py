@@ -1,11 +1,21 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Final, Dict, Any
 
+ROOT_DIR: Final[Path] = Path(__file__).resolve().parent.parent
+CONFIG_PATH: Final[Path] = ROOT_DIR / "config.json"
+
+
+@lru_cache(maxsize=1)
+def get_config(path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    """Load and parse the JSON config file once per process."""
+    # Single read of the raw bytes; json.loads detects the UTF-8 encoding itself
+    return json.loads(Path(path).read_bytes())
+
+
 # Load config from JSON file
-CONFIG_PATH: Final[Path] = Path(__file__).parent.parent / "config.json"
-with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-    config: Dict[str, Any] = json.load(f)
+config: Dict[str, Any] = get_config()
 
 LOG_LEVEL: Final[str] = config.get("LOG_LEVEL", "WARNING")
 
@@ -15,11 +25,12 @@ ENCODING: Final[str] = config["ENCODING"]
 DEBUG: Final[bool] = config["DEBUG"]
 PORT: Final[int] = config["PORT"]
 
-# File paths
-INTERNAL_CSV_PATH: Final[Path] = Path(DATA_DIR) / config["FILES"]["INTERNAL_CSV"]
-EXTERNAL_CSV_PATH: Final[Path] = Path(DATA_DIR) / config["FILES"]["EXTERNAL_CSV"]
-MATCHES_CSV_PATH: Final[Path] = Path(DATA_DIR) / config["FILES"]["MATCHES_CSV"]
-ACCEPTED_CSV_PATH: Final[Path] = Path(DATA_DIR) / config["FILES"]["ACCEPTED_CSV"]
+# File paths (DATA_DIR is resolved against the project root, not the working directory)
+DATA_PATH: Final[Path] = ROOT_DIR / DATA_DIR
+INTERNAL_CSV_PATH: Final[Path] = DATA_PATH / config["FILES"]["INTERNAL_CSV"]
+EXTERNAL_CSV_PATH: Final[Path] = DATA_PATH / config["FILES"]["EXTERNAL_CSV"]
+MATCHES_CSV_PATH: Final[Path] = DATA_PATH / config["FILES"]["MATCHES_CSV"]
+ACCEPTED_CSV_PATH: Final[Path] = DATA_PATH / config["FILES"]["ACCEPTED_CSV"]
 
 # Matching configuration
 FIELD_WEIGHTS: Final[Dict[str, float]] = config["MATCHING"]["FIELD_WEIGHTS"]
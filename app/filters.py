@@ -1,13 +1,18 @@
 import re
 import base64
+from functools import lru_cache
 
+# Matches the position before each uppercase letter (except at the start)
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
+
+@lru_cache(maxsize=256)
 def camel_to_title(text):
     """Convert camelCase or snake_case to Title Case with spaces."""
     # Replace underscores with spaces
     text = text.replace("_", " ")
     # Insert space before uppercase letters (except the first one)
-    text = re.sub(r"(?<!^)(?=[A-Z])", " ", text)
+    text = _CAMEL_RE.sub(" ", text)
     # Capitalize first letter of each word
     return text.title()
 
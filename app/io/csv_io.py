@@ -1,8 +1,11 @@
 """Data loading and writing functions for patient matching."""
 
 import logging as log
+import atexit
 import csv
 import os
+import threading
+from operator import itemgetter
 from pathlib import Path
 from typing import Union, List, Tuple
 from app.config import (
@@ -17,27 +20,90 @@ from app.models.match_output import MatchOutput
 
 
 OUTPUT_HEADER = ["ExternalPatientId", "InternalPatientId"]
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB read buffer for patient CSVs
+
+# CSV columns in Patient field order, following the patient id column
+PATIENT_COLUMNS = (
+    "FirstName",
+    "LastName",
+    "DOB",
+    "Sex",
+    "PhoneNumber",
+    "Address",
+    "City",
+    "ZipCode",
+)
+
+
+class _AppendWriter:
+    """CSV writer that keeps one file open in append mode across single-row writes."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = path
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def writerow(self, row: list) -> None:
+        """
+        Append a row and flush it to disk. The file is opened on first use and
+        reopened if the path no longer refers to it (deleted or rotated).
+        """
+        with self._lock:
+            if self._file is not None and not self._is_current():
+                self._file.close()
+                self._file = self._writer = None
+            if self._file is None:
+                # pylint: disable-next=consider-using-with
+                self._file = open(self.path, "a", newline="", encoding=ENCODING)
+                self._writer = csv.writer(self._file)
+            self._writer.writerow(row)
+            self._file.flush()
+
+    def _is_current(self) -> bool:
+        """Whether the open handle is still the file at self.path."""
+        try:
+            path_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return os.path.samestat(os.fstat(self._file.fileno()), path_stat)
+
+    def close(self) -> None:
+        """Close the underlying file; the next write reopens it."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = self._writer = None
+
+
+_accepted_writer = _AppendWriter(ACCEPTED_CSV_PATH)
+atexit.register(_accepted_writer.close)
 
 
 def load_patients(file_path: Union[str, Path], id_col: str) -> List[Patient]:
     """Load CSV file and return list of Patient objects."""
     try:
-        with open(file_path, newline="", encoding=ENCODING) as f:
-            reader = csv.DictReader(f)
-            return [
-                Patient(
-                    patient_id=row[id_col],
-                    first_name=row["FirstName"],
-                    last_name=row["LastName"],
-                    dob=row["DOB"],
-                    sex=row["Sex"],
-                    phone_number=row["PhoneNumber"],
-                    address=row["Address"],
-                    city=row["City"],
-                    zipcode=row["ZipCode"],
-                )
-                for row in reader
-            ]
+        with open(
+            file_path, newline="", encoding=ENCODING, buffering=CSV_BUFFER_SIZE
+        ) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+            # Resolve column positions once, then project each row in C with
+            # itemgetter instead of building a dict per row
+            col = {name: i for i, name in enumerate(header)}
+            project = itemgetter(col[id_col], *(col[name] for name in PATIENT_COLUMNS))
+            width = len(header)
+            patients = []
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    # Missing trailing fields read as None, as with csv.DictReader
+                    row += [None] * (width - len(row))
+                patients.append(Patient(*project(row)))
+            return patients
     except IOError as e:
         log.error("Error loading %s: %s", file_path, e)
         return []
@@ -53,16 +119,16 @@ def load_data() -> Tuple[List[Patient], List[Patient]]:
 def write_match(output: MatchOutput) -> bool:
     """Write an accepted match to the accepted CSV file."""
     try:
-        with open(ACCEPTED_CSV_PATH, "a", newline="", encoding=ENCODING) as f:
-            csv.writer(f).writerow([output.external_id, output.internal_id])
+        _accepted_writer.writerow([output.external_id, output.internal_id])
         return True
-    except ValueError as e:
+    except (OSError, ValueError) as e:
         log.error("Error writing match: %s", e)
         return False
 
 
 def create_output_files():
     """Create (overwrite) matches and accepted CSV files with headers."""
+    _accepted_writer.close()
     os.makedirs(MATCHES_CSV_PATH.parent, exist_ok=True)
     os.makedirs(ACCEPTED_CSV_PATH.parent, exist_ok=True)
     for path in [MATCHES_CSV_PATH, ACCEPTED_CSV_PATH]:
@@ -75,10 +141,6 @@ def write_all_matches(matches: list):
     with open(MATCHES_CSV_PATH, "w", newline="", encoding=ENCODING) as f:
         writer = csv.writer(f)
         writer.writerow(OUTPUT_HEADER)
-        for m in matches:
-            writer.writerow(
-                [
-                    m.external.patient_id,
-                    m.internal.patient_id,
-                ]
-            )
+        writer.writerows(
+            (m.external.patient_id, m.internal.patient_id) for m in matches
+        )
@@ -4,6 +4,7 @@ This module provides similarity calculations for different field types in patien
 including names, phone numbers, addresses, and general text fields.
 """
 
+from functools import lru_cache
 from app.config import (
     PHONE_PARTIAL_MATCH,
 )
@@ -13,6 +14,8 @@ from .string_similarity import (
     jaccard_similarity,
     jaro_winkler_similarity,
     combined_jaccard_levenshtein_similarity,
+    _cached_token_ratio,
+    _tokenize,
 )
 from .normalization import _normalize_phone, normalize_string
 
@@ -26,37 +29,61 @@ def calculate_field_similarity(
     """
     norm1 = normalize_string(first_field, field_name)
     norm2 = normalize_string(second_field, field_name)
+    return calculate_normalized_field_similarity(norm1, norm2, field_type, field_name)
 
+
+def calculate_normalized_field_similarity(
+    norm1, norm2, field_type, field_name
+) -> FieldSimilarityResult:
+    """
+    Calculate similarity between two values that are already normalized
+    (e.g. a Patient's *_norm attributes), skipping normalize_string.
+    Returns a FieldSimilarityResult.
+    """
     if not norm1 or not norm2:
         return FieldSimilarityResult(0.0, "One more fields are empty")
     if norm1 == norm2:
         return FieldSimilarityResult(1.0, "exact")
 
-    match (field_name, field_type):
-        case (_, "exact"):
-            return FieldSimilarityResult(1.0 if norm1 == norm2 else 0.0, "exact")
-        case ("phone_number", _) | ("phone", _):
-            sim = phone_similarity(norm1, norm2)
-            return FieldSimilarityResult(sim, "levenshtein (phone)")
-        case ("address", _):
-            sim = combined_jaccard_levenshtein_similarity(norm1, norm2)
-            return FieldSimilarityResult(sim, "combined_jaccard_levenshtein")
-        case ("first_name", _):
-            sim = first_name_similarity(norm1, norm2)
-            return FieldSimilarityResult(sim, "jaro_winkler (first_name)")
-        case ("last_name", _):
-            sim = jaro_winkler_similarity(norm1, norm2)
-            return FieldSimilarityResult(sim, "jaro_winkler (last_name)")
-        case _:
-            return general_similarity(norm1, norm2)
+    return _similarity_for_normalized(norm1, norm2, field_type, field_name)
+
+
+@lru_cache(maxsize=65536)
+def _similarity_for_normalized(
+    norm1, norm2, field_type, field_name
+) -> FieldSimilarityResult:
+    """
+    Dispatch two distinct, non-empty normalized values to the field's scorer.
+    Memoized because names, cities and zip codes repeat across comparisons.
+    The key keeps argument order: the address scorer's greedy token pairing
+    is not symmetric.
+    """
+    handler = _TYPE_HANDLERS.get(field_type) or _FIELD_HANDLERS.get(
+        field_name, general_similarity
+    )
+    return handler(norm1, norm2)
+
+
+def clear_similarity_cache() -> None:
+    """Drop memoized field similarities (called at the start of each match run)."""
+    _similarity_for_normalized.cache_clear()
+    _tokenize.cache_clear()
+    _cached_token_ratio.cache_clear()
+    _first_token.cache_clear()
+
+
+@lru_cache(maxsize=16384)
+def _first_token(name: str) -> str:
+    """Return the first whitespace-separated token of a name (cached per name)."""
+    return name.split(maxsplit=1)[0]
 
 
 def first_name_similarity(name1, name2) -> float:
     """
     Compare first names using only the first token.
     """
-    n1 = name1.split()[0] if name1 else ""
-    n2 = name2.split()[0] if name2 else ""
+    n1 = _first_token(name1) if name1 else ""
+    n2 = _first_token(name2) if name2 else ""
     match (n1, n2):
         case ("", _) | (_, ""):
             return 0.0
@@ -72,14 +99,16 @@ def phone_similarity(phone1, phone2) -> float:
     """
     pn1 = _normalize_phone(phone1)
     pn2 = _normalize_phone(phone2)
-    match (pn1, pn2):
-        case (pn1, pn2) if pn1 == pn2 or (pn1 == "" and pn2 == ""):
-            return 1.0
-        case (pn1, pn2) if pn1 == "" or pn2 == "" or pn1 in pn2 or pn2 in pn1:
-            return PHONE_PARTIAL_MATCH
-        case _:
-            sim = levenshtein_similarity(pn1, pn2)
-            return sim if sim >= 0.5 else 0.0
+    if pn1 == pn2:
+        return 1.0
+    if not pn1 or not pn2:
+        return PHONE_PARTIAL_MATCH
+    # Only the shorter number can be contained in the longer one
+    shorter, longer = (pn1, pn2) if len(pn1) < len(pn2) else (pn2, pn1)
+    if shorter in longer:
+        return PHONE_PARTIAL_MATCH
+    sim = levenshtein_similarity(pn1, pn2)
+    return sim if sim >= 0.5 else 0.0
 
 
 def general_similarity(norm1, norm2) -> FieldSimilarityResult:
@@ -93,3 +122,49 @@ def general_similarity(norm1, norm2) -> FieldSimilarityResult:
     return FieldSimilarityResult(
         levenshtein_similarity(norm1, norm2), "levenshtein (general)"
     )
+
+
+def _exact_similarity(norm1, norm2) -> FieldSimilarityResult:
+    """Exact comparison of normalized strings."""
+    return FieldSimilarityResult(1.0 if norm1 == norm2 else 0.0, "exact")
+
+
+def _phone_field_similarity(norm1, norm2) -> FieldSimilarityResult:
+    """Phone comparison wrapped as a FieldSimilarityResult."""
+    return FieldSimilarityResult(phone_similarity(norm1, norm2), "levenshtein (phone)")
+
+
+def _address_field_similarity(norm1, norm2) -> FieldSimilarityResult:
+    """Address comparison wrapped as a FieldSimilarityResult."""
+    return FieldSimilarityResult(
+        combined_jaccard_levenshtein_similarity(norm1, norm2),
+        "combined_jaccard_levenshtein",
+    )
+
+
+def _first_name_field_similarity(norm1, norm2) -> FieldSimilarityResult:
+    """First name comparison wrapped as a FieldSimilarityResult."""
+    return FieldSimilarityResult(
+        first_name_similarity(norm1, norm2), "jaro_winkler (first_name)"
+    )
+
+
+def _last_name_field_similarity(norm1, norm2) -> FieldSimilarityResult:
+    """Last name comparison wrapped as a FieldSimilarityResult."""
+    return FieldSimilarityResult(
+        jaro_winkler_similarity(norm1, norm2), "jaro_winkler (last_name)"
+    )
+
+
+# Dispatch tables built once at import; a field_type handler takes precedence
+# over a field_name handler, and general_similarity is the fallback
+_TYPE_HANDLERS = {
+    "exact": _exact_similarity,
+}
+_FIELD_HANDLERS = {
+    "phone_number": _phone_field_similarity,
+    "phone": _phone_field_similarity,
+    "address": _address_field_similarity,
+    "first_name": _first_name_field_similarity,
+    "last_name": _last_name_field_similarity,
+}
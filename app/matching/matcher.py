@@ -6,12 +6,13 @@ for robust, configurable matching. The best match per external patient is return
 """
 
 from typing import List
-from collections import defaultdict
+from operator import attrgetter
 from app.models.patient import Patient
 from app.models.match_result import MatchResult
 from app.models.best_match import BestMatch
 from app.config import MATCH_THRESHOLD
-from app.matching.scoring import calculate_weighted_similarity
+from app.matching.scoring import calculate_weighted_similarity_raw
+from app.matching.field_similarity import clear_similarity_cache
 from app.matching.constants import PRECOMPUTED_NORMALIZATION_FIELDS
 from app.matching.utils import log_elapsed_time
 from app.models.match_score import MatchScore
@@ -23,24 +24,35 @@ def _find_best_internal_match(
     """
     Find the best matching internal patient for a given external patient based on similarity score.
     Assumes all internal_patients already match on normalized fields (pre-filtered).
-    Returns a BestMatch instance, or one with None and -1 if no candidates are provided.
+    Candidates that cannot reach MATCH_THRESHOLD are pruned while being scored.
+    Returns a BestMatch instance, or one with None and -1 if no candidate can reach it.
     """
     if not internal_patients:
 
         return BestMatch(internal=None, score=MatchScore(value=-1, breakdown={}))
 
-    def score_tuple(internal_patient: Patient):
-        score = calculate_weighted_similarity(external_patient, internal_patient)
-        return (internal_patient, score)
-
-    best_internal, best_score = max(
-        (score_tuple(internal_patient) for internal_patient in internal_patients),
-        key=lambda x: x[1].value,
-        default=(None, MatchScore(value=-1, breakdown={})),
-    )
+    # Track the best candidate as plain values; MatchScore is built once at the end
+    best_internal = None
+    best_value = -1.0
+    best_breakdown = {}
+    for internal_patient in internal_patients:
+        # Candidates that cannot reach the threshold or beat the current best
+        # stop scoring early and come back without a breakdown
+        value, breakdown = calculate_weighted_similarity_raw(
+            external_patient,
+            internal_patient,
+            min_score=max(best_value, MATCH_THRESHOLD),
+        )
+        if breakdown is not None and value > best_value:
+            best_internal = internal_patient
+            best_value = value
+            best_breakdown = breakdown
+            # No later candidate can beat a perfect score
+            if value >= 1.0:
+                break
     return BestMatch(
         internal=best_internal,
-        score=best_score,
+        score=MatchScore(value=best_value, breakdown=best_breakdown),
     )
 
 
@@ -59,19 +71,19 @@ def match_patients(
     if not internal or not external:
         return matches
 
-    # Build an index of internal patients by their normalized fields for efficient lookup
-    norm_fields = list(PRECOMPUTED_NORMALIZATION_FIELDS.values())
-    index = defaultdict(list)
+    clear_similarity_cache()
+
+    # Build an index of internal patients by their normalized fields for efficient lookup.
+    # The key getter is built once and reads every key field in a single C-level call.
+    block_key = attrgetter(*PRECOMPUTED_NORMALIZATION_FIELDS.values())
+    index = {}
     for patient in internal:
-        key = tuple(getattr(patient, norm_field, "") for norm_field in norm_fields)
-        index[key].append(patient)
+        index.setdefault(block_key(patient), []).append(patient)
 
     for external_patient in external:
-        key = tuple(
-            getattr(external_patient, norm_field, "") for norm_field in norm_fields
+        best_match = _find_best_internal_match(
+            external_patient, index.get(block_key(external_patient), [])
         )
-        candidates = index.get(key, [])
-        best_match = _find_best_internal_match(external_patient, candidates)
         if (
             best_match.score.value >= MATCH_THRESHOLD
             and best_match.internal is not None
@@ -3,6 +3,7 @@
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 # Address standardization mappings
 REPLACEMENTS = {
@@ -24,10 +25,60 @@ REPLACEMENTS = {
     "west": "w",
 }
 REPLACEMENTS_LOWER = {key.lower(): value for key, value in REPLACEMENTS.items()}
-REPLACEMENTS_PATTERN = re.compile(
-    r"\b(" + "|".join(REPLACEMENTS_LOWER.keys()) + r")\b", flags=re.IGNORECASE
+# Matched against already-lowercased text, so no IGNORECASE case-folding is needed
+REPLACEMENTS_PATTERN = re.compile(r"\b(" + "|".join(REPLACEMENTS_LOWER.keys()) + r")\b")
+
+
+def _replace_abbreviation(match: "re.Match[str]") -> str:
+    return REPLACEMENTS_LOWER[match.group(0)]
+
+
+def standardize_address(text: str) -> str:
+    """Replace address words with their standard abbreviations in one regex pass."""
+    return REPLACEMENTS_PATTERN.sub(_replace_abbreviation, text.lower())
+
+
+# Address that is only a unit designator, e.g. "APT 5" or "Suite 2"
+UNIT_ONLY_PATTERN = re.compile(
+    r"^(apt|apartment|suite|ste|unit|#)\s+(\w+)$", flags=re.IGNORECASE
+)
+# "<number> [<directional>] <suite-type>", e.g. "404 Suite" or "404 East Suite"
+NUMBER_UNIT_PATTERN = re.compile(
+    r"^(\d+)\s+(?:(north|south|east|west)\s+)?(suite|ste|apartment|apt|unit|#)$",
+    flags=re.IGNORECASE,
 )
 
+# DD-MMM-YYYY dates, e.g. "02-Dec-1978"
+DD_MMM_YYYY_PATTERN = re.compile(r"^\d{1,2}-[A-Za-z]{3}-\d{4}$")
+
+# Address punctuation to blank out (hyphens are kept)
+ADDRESS_PUNCTUATION_PATTERN = re.compile(r"[^\w\s-]")
+
+# extract_base_address patterns
+LEADING_UNIT_PATTERN = re.compile(
+    r"^(Apt|Apartment|Suite|Ste|Unit|#)\b", flags=re.IGNORECASE
+)
+LEADING_ZEROS_PATTERN = re.compile(r"^0+(\d[\w\-]*)")
+UNIT_SPLIT_PATTERN = re.compile(
+    r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b", flags=re.IGNORECASE
+)
+TRAILING_PUNCTUATION_PATTERN = re.compile(r"[\s,\.]+$")
+# Lowercase substrings that any unit designator above must contain
+UNIT_KEYWORDS = ("apt", "apartment", "suite", "ste", "unit", "#")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Deletes every ASCII non-digit in a single str.translate pass
+ASCII_NON_DIGITS_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# Deletes ASCII punctuation (anything but word characters and whitespace)
+ASCII_PUNCTUATION_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not re.match(r"[\w\s]", chr(c)))
+)
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
 
 def normalize_date(date_str: str) -> str:
     """Normalize date from DD-MMM-YYYY to YYYY-MM-DD format, leave others unchanged."""
@@ -37,7 +88,7 @@ def normalize_date(date_str: str) -> str:
     date_str = date_str.strip()
 
     # Check if it matches DD-MMM-YYYY pattern (e.g., "02-Dec-1978")
-    if re.match(r"^\d{1,2}-[A-Za-z]{3}-\d{4}$", date_str):
+    if DD_MMM_YYYY_PATTERN.match(date_str):
         try:
             parsed_date = datetime.strptime(date_str, "%d-%b-%Y")
             return parsed_date.strftime("%Y-%m-%d")
@@ -52,9 +103,17 @@ def normalize_date(date_str: str) -> str:
     return date_str
 
 
+@lru_cache(maxsize=8192)
 def _normalize_phone(phone_str: str) -> str:
     """Normalize phone number to digits only."""
-    return re.sub(r"\D", "", phone_str) if phone_str else ""
+    if not phone_str:
+        return ""
+    # Already digits only (e.g. a normalized value); isdecimal matches exactly \d
+    if phone_str.isdecimal():
+        return phone_str
+    digits = phone_str.translate(ASCII_NON_DIGITS_TABLE)
+    # Non-ASCII characters survive the table; let the regex handle those
+    return digits if digits.isascii() else NON_DIGIT_PATTERN.sub("", digits)
 
 
 def extract_base_address(addr: str) -> str:
@@ -67,77 +126,75 @@ def extract_base_address(addr: str) -> str:
 
     addr = addr.strip()
 
+    # Common case first: most addresses carry no unit designator, so plain
+    # substring checks let them skip the unit regexes. Non-ASCII input always
+    # takes the regex path, since IGNORECASE folds characters lower() doesn't.
+    lowered = addr.lower()
+    has_unit = not addr.isascii() or any(k in lowered for k in UNIT_KEYWORDS)
+
     # If address starts with apartment/unit/suite, return empty string
-    if re.match(r"^(Apt|Apartment|Suite|Ste|Unit|#)\b", addr, flags=re.IGNORECASE):
+    if has_unit and LEADING_UNIT_PATTERN.match(addr):
         return ""
 
     # If address is just a number (possibly with leading zeros)
-    if re.fullmatch(r"0*\d+", addr):
+    if addr.isdecimal():
         return str(int(addr))
 
     # Remove leading zeros from house numbers (including hyphenated, e.g., 0456-B)
-    addr = re.sub(r"^0+(\d[\w\-]*)", r"\1", addr)
+    if addr.startswith("0"):
+        addr = LEADING_ZEROS_PATTERN.sub(r"\1", addr)
 
     # Remove apartment/unit/suite info and everything after
-    addr = re.split(
-        r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b", addr, flags=re.IGNORECASE
-    )[0]
+    if has_unit:
+        addr = UNIT_SPLIT_PATTERN.split(addr, maxsplit=1)[0]
 
     # Remove any trailing punctuation and whitespace (including spaces before punctuation)
-    addr = re.sub(r"[\s,\.]+$", "", addr)
+    addr = TRAILING_PUNCTUATION_PATTERN.sub("", addr)
 
     # Collapse spaces and trim
-    return re.sub(r"\s+", " ", addr).strip()
+    return " ".join(addr.split())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_address(addr_str: str) -> str:
     """Normalize address for comparison."""
     if not addr_str:
         return ""
 
+    stripped = addr_str.strip()
+
     # Special case: if address is just "APT 5", "Suite 2", etc.
-    m = re.match(
-        r"^(apt|apartment|suite|ste|unit|#)\s+(\w+)$", addr_str.strip(), re.IGNORECASE
-    )
+    m = UNIT_ONLY_PATTERN.match(stripped)
     if m:
         abbrev = REPLACEMENTS_LOWER.get(m.group(1).lower(), m.group(1).lower())
         return f"{abbrev} {m.group(2).lower()}"
 
-    # Special case: if address is "<number> <suite-type>"
-    m2 = re.match(
-        r"^(\d+)\s+(suite|ste|apartment|apt|unit|#)$", addr_str.strip(), re.IGNORECASE
-    )
-    if m2:
-        abbrev = REPLACEMENTS_LOWER.get(m2.group(2).lower(), m2.group(2).lower())
-        return f"{m2.group(1)} {abbrev}"
-
-    # Special case: if address is "<number> <directional> <suite-type>"
-    m3 = re.match(
-        r"^(\d+)\s+(north|south|east|west)\s+(suite|ste|apartment|apt|unit|#)$",
-        addr_str.strip(),
-        re.IGNORECASE,
-    )
-    if m3:
-        abbrev_dir = REPLACEMENTS_LOWER.get(m3.group(2).lower(), m3.group(2).lower())
-        abbrev_suite = REPLACEMENTS_LOWER.get(m3.group(3).lower(), m3.group(3).lower())
-        return f"{m3.group(1)} {abbrev_dir} {abbrev_suite}"
+    # Special case: if address is "<number> [<directional>] <suite-type>"
+    m = NUMBER_UNIT_PATTERN.match(stripped)
+    if m:
+        number, direction, suite = m.groups()
+        abbrev_suite = REPLACEMENTS_LOWER.get(suite.lower(), suite.lower())
+        if direction:
+            abbrev_dir = REPLACEMENTS_LOWER.get(direction.lower(), direction.lower())
+            return f"{number} {abbrev_dir} {abbrev_suite}"
+        return f"{number} {abbrev_suite}"
 
     # Use base address (strip apartment/unit/suite)
     normalized = extract_base_address(addr_str).lower().strip()
 
     # Standardize common abbreviations
-    normalized = REPLACEMENTS_PATTERN.sub(
-        lambda match: REPLACEMENTS_LOWER[match.group(0).lower()], normalized
-    )
+    normalized = standardize_address(normalized)
 
     # Remove extra spaces and punctuation, but preserve hyphens
-    normalized = re.sub(r"[^\w\s-]", " ", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+    normalized = ADDRESS_PUNCTUATION_PATTERN.sub(" ", normalized)
+    return WHITESPACE_PATTERN.sub(" ", normalized).strip()
 
 
+@lru_cache(maxsize=16384)
 def normalize_string(s: str, field_name: str) -> str:
     """
     Normalize string for comparison based on the field type.
+    Results are cached per (value, field), since names, cities and dates repeat.
 
     Args:
         s: The input string to normalize.
@@ -159,5 +216,9 @@ def normalize_string(s: str, field_name: str) -> str:
             return _normalize_address(s)
         case _:
             # General string normalization
-            normalized = re.sub(r"[^\w\s]", "", str(s).lower())
-            return re.sub(r"\s+", " ", normalized).strip()
+            normalized = str(s).lower().translate(ASCII_PUNCTUATION_TABLE)
+            if not normalized.isascii():
+                # Non-ASCII punctuation survives the table; let the regex handle it
+                normalized = PUNCTUATION_PATTERN.sub("", normalized)
+            # split() with no arguments also trims and collapses all whitespace
+            return " ".join(normalized.split())
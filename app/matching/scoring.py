@@ -4,6 +4,7 @@ This module provides functions to calculate the weighted similarity score betwee
 It uses configurable field weights and types, and supports penalizing missing data for critical fields.
 """
 
+from typing import Any, Dict, Optional, Tuple
 from app.models.patient import Patient
 from app.config import FIELD_WEIGHTS, FIELD_TYPES
 from app.matching.constants import (
@@ -13,27 +14,38 @@ from app.matching.constants import (
 )
 from app.models.match_score import MatchScore
 from app.models.field_similarity_result import FieldSimilarityResult
-from .field_similarity import calculate_field_similarity
+from .field_similarity import calculate_normalized_field_similarity
 
+# Shared results for a field that is empty on either side
+_EMPTY_CRITICAL_RESULT = FieldSimilarityResult(0.0, "empty")
+_EMPTY_OPTIONAL_RESULT = FieldSimilarityResult(0.5, "empty")
 
-def _get_normalized_precompute_values(
-    patient1: Patient, patient2: Patient, field_name: str
-):
-    """
-    Return normalized values for a field, using normalized attributes if available.
+# Slack for float rounding when pruning against min_score
+PRUNE_TOLERANCE = 1e-9
 
-    Args:
-        patient1 (Patient): The first patient object.
-        patient2 (Patient): The second patient object.
-        field_name (str): The name of the field to normalize.
 
-    Returns:
-        Tuple[str, str]: The normalized values for the field from both patients.
+def _build_field_spec(field_weights, field_types, normalized_fields, critical_fields):
+    """
+    Resolve the per-field scoring settings once, as a tuple of
+    (field_name, weight, field_type, normalized attribute, is_critical) entries.
     """
-    norm_field = NORMALIZED_FIELDS.get(field_name, f"{field_name}_norm")
-    n1 = getattr(patient1, norm_field, "")
-    n2 = getattr(patient2, norm_field, "")
-    return n1, n2
+    return tuple(
+        (
+            field_name,
+            weight,
+            field_types.get(field_name, "general"),
+            normalized_fields.get(field_name, f"{field_name}_norm"),
+            field_name in critical_fields,
+        )
+        for field_name, weight in field_weights.items()
+    )
+
+
+_FIELD_SPEC = _build_field_spec(
+    FIELD_WEIGHTS, FIELD_TYPES, NORMALIZED_FIELDS, CRITICAL_FIELDS
+)
+# Sum of all field weights, the denominator when pruning against min_score
+_TOTAL_WEIGHT = sum(spec[1] for spec in _FIELD_SPEC)
 
 
 def _update_breakdown_and_score(breakdown, field_name, sim, weight, algorithm=None):
@@ -74,34 +86,60 @@ def calculate_weighted_similarity(patient1: Patient, patient2: Patient) -> Match
     Returns:
         MatchScore: An object containing the final similarity score and a breakdown of field similarities.
     """
-    # Ensure all normalized fields are present
-    patient1.normalize_fields()
-    patient2.normalize_fields()
+    value, breakdown = calculate_weighted_similarity_raw(patient1, patient2)
+    return MatchScore(
+        value=value,
+        breakdown=breakdown,
+    )
+
+
+# Per-field spec values and the pruning bounds are unpacked into locals so the
+# loop run for every candidate pair avoids repeated lookups
+# pylint: disable-next=too-many-locals
+def calculate_weighted_similarity_raw(
+    patient1: Patient, patient2: Patient, min_score: Optional[float] = None
+) -> Tuple[float, Optional[Dict[str, Dict[str, Any]]]]:
+    """
+    Calculate the weighted similarity score as a plain (value, breakdown) tuple.
+
+    Used by the matcher's candidate loop so that a MatchScore is only built for
+    the winning candidate; see calculate_weighted_similarity for details.
+
+    If min_score is given, scoring stops as soon as the remaining fields can no
+    longer lift the score above it, and (upper_bound, None) is returned.
+    """
+    # Normalize each patient once, on its first comparison
+    patient1.ensure_normalized()
+    patient2.ensure_normalized()
 
     total_weighted_score = DEFAULT_SIMILARITY
     total_weight_used = DEFAULT_SIMILARITY
     breakdown = {}
 
-    for field_name, weight in FIELD_WEIGHTS.items():
-        n1, n2 = _get_normalized_precompute_values(patient1, patient2, field_name)
-        # Penalize missing data for critical fields
-        if (not n1 or not n2) and field_name in CRITICAL_FIELDS:
-            fsim = FieldSimilarityResult(0.0, "empty")
-        elif not n1 or not n2:
-            fsim = FieldSimilarityResult(0.5, "empty")
+    if min_score is not None:
+        # Weighted sum the score must reach to beat min_score (with float slack)
+        required_weighted_score = min_score * _TOTAL_WEIGHT - PRUNE_TOLERANCE
+
+    for field_name, weight, field_type, norm_field, critical in _FIELD_SPEC:
+        n1 = getattr(patient1, norm_field, "")
+        n2 = getattr(patient2, norm_field, "")
+        if not n1 or not n2:
+            # Penalize missing data for critical fields; skip the field scorer entirely
+            fsim = _EMPTY_CRITICAL_RESULT if critical else _EMPTY_OPTIONAL_RESULT
         else:
-            fsim = calculate_field_similarity(
-                n1, n2, FIELD_TYPES.get(field_name, "general"), field_name
-            )
+            fsim = calculate_normalized_field_similarity(n1, n2, field_type, field_name)
         wscore = _update_breakdown_and_score(
             breakdown, field_name, fsim.similarity, weight, fsim.algorithm
         )
         total_weighted_score += wscore
         total_weight_used += weight
 
+        if min_score is not None:
+            # Every remaining field can add at most its full weight
+            best_possible = total_weighted_score + (_TOTAL_WEIGHT - total_weight_used)
+            if best_possible < required_weighted_score:
+                return best_possible / _TOTAL_WEIGHT, None
+
     final_score = total_weighted_score / total_weight_used if total_weight_used else 0.0
     final_score = max(DEFAULT_SIMILARITY, final_score)
-    return MatchScore(
-        value=final_score,
-        breakdown=breakdown,
-    )
+    return final_score, breakdown
@@ -1,8 +1,13 @@
 """String similarity algorithms for patient matching and record linkage."""
 
-from typing import Set, Tuple
+import sys
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
 from .constants import JARO_THRESHOLD
 
+# Longest pattern handed to the bit-parallel Levenshtein kernel (one 64-bit word)
+BIT_PARALLEL_MAX_LEN = 64
+
 
 def validate_strings(s1: str, s2: str) -> Tuple[str, str]:
     """Ensure both inputs are strings and strip leading and trailing whitespace."""
@@ -11,35 +16,116 @@ def validate_strings(s1: str, s2: str) -> Tuple[str, str]:
     return s1.strip(), s2.strip()
 
 
-def _tokenize(text: str) -> Set[str]:
-    """Tokenize text into a set of lowercase words."""
-    return set(text.lower().split())
+@lru_cache(maxsize=32768)
+def _tokenize(text: str) -> FrozenSet[str]:
+    """
+    Tokenize text into a set of lowercase words (cached per distinct string).
+
+    Tokens are interned so equal tokens from different records are the same
+    object, letting set and cache-key comparisons short-circuit on identity.
+    """
+    return frozenset(map(sys.intern, text.lower().split()))
 
 
-def levenshtein_distance(a: str, b: str) -> int:
-    """Compute Levenshtein edit distance between two strings."""
-    if not a:
-        return len(b)
-    if not b:
-        return len(a)
+def levenshtein_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Compute Levenshtein edit distance between two strings.
+
+    If max_distance is given, stop as soon as the distance is known to exceed it
+    and return max_distance + 1 instead of the exact value.
+    """
     if len(a) > len(b):
         a, b = b, a
+    if max_distance is None:
+        max_distance = len(b)
+    elif len(b) - len(a) > max_distance:
+        return max_distance + 1
+    if not a:
+        return len(b)
+    if len(a) <= BIT_PARALLEL_MAX_LEN:
+        return _levenshtein_bit_parallel(a, b, max_distance)
+    return _levenshtein_dp(a, b, max_distance)
+
+
+# The bit-vector state lives in locals on purpose: attribute or container
+# access would cost more than the arithmetic in the per-character loop
+# pylint: disable-next=too-many-locals
+def _levenshtein_bit_parallel(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance via Hyyrö's bit-parallel variant of Myers' algorithm.
+
+    Each bit of the int state vectors is one row of the DP column for pattern a,
+    so a whole column is updated with a few int operations per character of b.
+    Both strings must be non-empty. Returns max_distance + 1 once exceeded.
+    """
+    peq = {}
+    for i, ch in enumerate(a):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    vp, vn, dist = mask, 0, len(a)
+    # Each remaining character of b can lower the distance by at most one
+    limit = len(b) + max_distance
+    for j, ch in enumerate(b, 1):
+        eq = peq.get(ch, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        if hp & last:
+            dist += 1
+        elif hn & last:
+            dist -= 1
+        if dist + j > limit:
+            return max_distance + 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+    return dist
+
+
+def _levenshtein_dp(a: str, b: str, max_distance: int) -> int:
+    """
+    Row-by-row Wagner-Fischer Levenshtein distance, for long patterns.
+    Returns max_distance + 1 when the distance exceeds it, stopping early once
+    every cell of a row does.
+    """
+    if a.isascii() and b.isascii():
+        # Indexing bytes yields cached small ints instead of one-char strings
+        a, b = a.encode("ascii"), b.encode("ascii")
     prev_row = list(range(len(b) + 1))
+    curr_row = prev_row[:]
     for i, ca in enumerate(a):
-        curr_row = [i + 1]
+        curr_row[0] = left = i + 1
         for j, cb in enumerate(b):
-            substitution_cost = 1 if ca != cb else 0
+            subst = prev_row[j] + (ca != cb)
             insert = prev_row[j + 1] + 1
-            delete = curr_row[j] + 1
-            subst = prev_row[j] + substitution_cost
-            curr_row.append(min(insert, delete, subst))
-        prev_row = curr_row
-    return prev_row[-1]
+            left += 1
+            # Plain comparisons avoid a min() call per cell in this hot loop
+            if insert < subst:  # pylint: disable=consider-using-min-builtin
+                subst = insert
+            if left < subst:  # pylint: disable=consider-using-min-builtin
+                subst = left
+            curr_row[j + 1] = left = subst
+        # Row minima never decrease, so the final distance is at least this
+        if min(curr_row) > max_distance:
+            return max_distance + 1
+        prev_row, curr_row = curr_row, prev_row
+    dist = prev_row[-1]
+    return dist if dist <= max_distance else max_distance + 1
 
 
 def levenshtein_similarity(s1: str, s2: str) -> float:
     """Normalized Levenshtein similarity (0.0–1.0)."""
     s1, s2 = validate_strings(s1, s2)
+    if s1 == s2:
+        return 1.0
+    return _levenshtein_ratio(s1, s2)
+
+
+def _levenshtein_ratio(s1: str, s2: str) -> float:
+    """Normalized Levenshtein similarity for already-validated strings."""
     max_len = max(len(s1), len(s2))
     if max_len == 0:
         return 1.0
@@ -47,6 +133,28 @@ def levenshtein_similarity(s1: str, s2: str) -> float:
     return 1.0 - (dist / max_len)
 
 
+def _levenshtein_ratio_at_least(s1: str, s2: str, threshold: float) -> float:
+    """
+    Normalized Levenshtein similarity, or 0.0 as soon as it is certain to fall
+    below threshold (the distance computation is bounded accordingly).
+    """
+    max_len = max(len(s1), len(s2))
+    if max_len == 0:
+        return 1.0
+    # One edit of slack so float rounding never rejects a ratio exactly at threshold
+    max_distance = int((1.0 - threshold) * max_len) + 1
+    dist = levenshtein_distance(s1, s2, max_distance)
+    if dist > max_distance:
+        return 0.0
+    return 1.0 - (dist / max_len)
+
+
+@lru_cache(maxsize=65536)
+def _cached_token_ratio(t1: str, t2: str, threshold: float) -> float:
+    """Memoized bounded token ratio; callers pass the pair in sorted order."""
+    return _levenshtein_ratio_at_least(t1, t2, threshold)
+
+
 def jaccard_similarity(s1: str, s2: str) -> float:
     """Jaccard similarity for token sets (0.0–1.0)."""
     s1, s2 = validate_strings(s1, s2)
@@ -55,9 +163,11 @@ def jaccard_similarity(s1: str, s2: str) -> float:
         return 1.0
     if not tokens1 or not tokens2:
         return 0.0
-    intersection = tokens1 & tokens2
-    union = tokens1 | tokens2
-    return len(intersection) / len(union)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never materialized
+    if len(tokens1) > len(tokens2):
+        tokens1, tokens2 = tokens2, tokens1
+    intersection = len(tokens1.intersection(tokens2))
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
 
 
 def compute_jaro_similarity(s1: str, s2: str) -> float:
@@ -72,6 +182,11 @@ def compute_jaro_similarity(s1: str, s2: str) -> float:
     - |s1| and |s2| are the lengths of the strings s1 and s2.
     """
     s1, s2 = validate_strings(s1, s2)
+    return _jaro_similarity(s1, s2)
+
+
+def _jaro_similarity(s1: str, s2: str) -> float:
+    """Jaro similarity for already-validated strings."""
     if not s1 and not s2:
         return 1.0
     if not s1 or not s2:
@@ -88,56 +203,56 @@ def compute_jaro_similarity(s1: str, s2: str) -> float:
     return (match_ratio_s1 + match_ratio_s2 + transposition_ratio) / 3
 
 
+# Position masks and window bounds are kept in locals for the per-character loop
+# pylint: disable-next=too-many-locals
 def _find_jaro_matches(s1: str, s2: str) -> Tuple[int, int]:
-    """Find matches and transpositions for Jaro similarity."""
-    s1, s2 = validate_strings(s1, s2)
+    """
+    Find matches and transpositions for Jaro similarity.
+
+    Bit-parallel: each character of s2 maps to an int bitmask of its positions,
+    so the first unmatched occurrence inside the match window is one AND plus a
+    lowest-set-bit extraction instead of a scan over the window.
+    """
     len1, len2 = len(s1), len(s2)
-    window = max(len1, len2) // 2 - 1 if len1 > 0 and len2 > 0 else 0
     if len1 == 0 or len2 == 0:
-        window = 0
-    s1_matches, s2_matches, matches = _find_character_matches(s1, s2, window)
-    transpositions = (
-        _count_transpositions(s1, s2, s1_matches, s2_matches) if matches else 0
-    )
-    return matches, transpositions
+        return 0, 0
+    window = max(len1, len2) // 2 - 1
 
+    positions = {}
+    for j, ch in enumerate(s2):
+        positions[ch] = positions.get(ch, 0) | (1 << j)
 
-def _find_character_matches(s1: str, s2: str, window: int) -> Tuple[list, list, int]:
-    """Find matching characters within a window for Jaro."""
-    len1, len2 = len(s1), len(s2)
-    s1_matches = [False] * len1
-    s2_matches = [False] * len2
-    matches = 0
-    for i in range(len1):
+    s2_matched = 0
+    s1_matched_chars = []
+    for i, ch in enumerate(s1):
+        available = positions.get(ch, 0) & ~s2_matched
+        if not available:
+            continue
         start = max(0, i - window)
         end = min(i + window + 1, len2)
-        for j in range(start, end):
-            if not s2_matches[j] and s1[i] == s2[j]:
-                s1_matches[i] = s2_matches[j] = True
-                matches += 1
-                break
-    return s1_matches, s2_matches, matches
-
+        if end <= start:
+            continue
+        in_window = available & ((1 << end) - (1 << start))
+        if in_window:
+            s2_matched |= in_window & -in_window
+            s1_matched_chars.append(ch)
 
-def _count_transpositions(s1: str, s2: str, s1_matches: list, s2_matches: list) -> int:
-    """Count transpositions for Jaro similarity."""
+    # Matched characters of s1 in order against matched positions of s2 in order
     transpositions = 0
-    k = 0
-    for i, matched in enumerate(s1_matches):
-        if not matched:
-            continue
-        while not s2_matches[k]:
-            k += 1
-        if s1[i] != s2[k]:
+    for ch in s1_matched_chars:
+        lowest = s2_matched & -s2_matched
+        if s2[lowest.bit_length() - 1] != ch:
             transpositions += 1
-        k += 1
-    return transpositions
+        s2_matched ^= lowest
+    return len(s1_matched_chars), transpositions
 
 
 def jaro_winkler_similarity(s1: str, s2: str, prefix_weight: float = 0.1) -> float:
     """Jaro-Winkler similarity (0.0–1.0) with prefix bonus."""
     s1, s2 = validate_strings(s1, s2)
-    jaro = compute_jaro_similarity(s1, s2)
+    if s1 == s2:
+        return 1.0
+    jaro = _jaro_similarity(s1, s2)
     if jaro < JARO_THRESHOLD:
         return jaro
     prefix_len = 0
@@ -176,7 +291,12 @@ def combined_jaccard_levenshtein_similarity(
         best_j, best_sim = None, 0.0
         for j, t2 in enumerate(tokens2):
             if j not in matched_indices:
-                sim = levenshtein_similarity(t1, t2)
+                # Address tokens repeat heavily across records; the distance is
+                # symmetric, so order the pair to share one cache entry
+                if t1 <= t2:
+                    sim = _cached_token_ratio(t1, t2, token_sim_threshold)
+                else:
+                    sim = _cached_token_ratio(t2, t1, token_sim_threshold)
                 if sim > best_sim:
                     best_j, best_sim = j, sim
         if best_j is not None and best_sim >= token_sim_threshold:
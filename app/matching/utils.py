@@ -1,6 +1,5 @@
 """Utility functions for patient matching."""
 
-import re
 import time
 import logging
 from typing import List, Dict, Any
@@ -12,27 +11,6 @@ from functools import wraps
 
 FALLBACK_PATIENT_ID = "UNKNOWN"
 
-# Address standardization mappings
-REPLACEMENTS = {
-    "street": "st",
-    "stret": "st",  # common typo
-    "avenue": "ave",
-    "boulevard": "blvd",
-    "drive": "dr",
-    "place": "pl",
-    "court": "ct",
-    "apartment": "apt",
-    "suite": "ste",
-    "north": "n",
-    "south": "s",
-    "east": "e",
-    "west": "w",
-}
-REPLACEMENTS_LOWER = {key.lower(): value for key, value in REPLACEMENTS.items()}
-REPLACEMENTS_PATTERN = re.compile(
-    r"\b(" + "|".join(REPLACEMENTS_LOWER.keys()) + r")\b", flags=re.IGNORECASE
-)
-
 # ============================================================================
 # PATIENT RECORD UTILITIES
 # ============================================================================
@@ -63,9 +41,12 @@ def log_elapsed_time(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        elapsed = time.time() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return result
 
         # Try to get class name if this is a method
         if args and hasattr(args[0], "__class__"):
@@ -74,7 +55,7 @@ def log_elapsed_time(func):
         else:
             func_name = func.__name__
 
-        logging.info("%s completed in %.3f seconds.", func_name, elapsed)
+        logging.info("%s completed in %.3f ms.", func_name, elapsed_ns / 1e6)
         return result
 
     return wrapper
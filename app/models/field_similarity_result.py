@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class FieldSimilarityResult:
     """
     Represents the result of a similarity comparison between two fields.
@@ -9,6 +9,8 @@ class FieldSimilarityResult:
     Attributes:
         similarity (float): The computed similarity score between the fields.
         algorithm (str): The name of the algorithm used to compute the similarity.
+
+    Instances are immutable because memoized results are shared between comparisons.
     """
 
     similarity: float
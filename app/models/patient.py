@@ -1,9 +1,15 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field as dataclass_field
 from app.matching.normalization import normalize_string
 from app.matching.constants import PRECOMPUTED_NORMALIZATION_FIELDS, NORMALIZED_FIELDS
 
 
-@dataclass
+def _norm_slot():
+    """Declare a normalized-value slot, kept out of __init__, repr and equality."""
+    return dataclass_field(default="", init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True)
 class Patient:
     """
     Data class representing a patient.
@@ -19,6 +25,11 @@ class Patient:
         city (str): City of residence.
         zipcode (str): Postal code of the patient's address.
         score (float): Similarity score for matching (default is 0.0).
+        fields_normalized (bool): Whether all normalized field attributes are attached.
+
+    The *_norm attributes hold the normalized value of each field (see
+    NORMALIZED_FIELDS). They are declared up front because the class uses
+    __slots__, which avoids a per-instance __dict__.
     """
 
     patient_id: str
@@ -31,6 +42,17 @@ class Patient:
     city: str
     zipcode: str
     score: float = 0.0
+    fields_normalized: bool = dataclass_field(
+        default=False, init=False, repr=False, compare=False
+    )
+    first_name_norm: str = _norm_slot()
+    last_name_norm: str = _norm_slot()
+    dob_norm: str = _norm_slot()
+    sex_norm: str = _norm_slot()
+    phone_number_norm: str = _norm_slot()
+    address_norm: str = _norm_slot()
+    city_norm: str = _norm_slot()
+    zipcode_norm: str = _norm_slot()
 
     def __post_init__(self):
         self.normalize_precomputed_fields()
@@ -38,11 +60,29 @@ class Patient:
     def normalize_precomputed_fields(self):
         """Attach normalized fields as attributes to this Patient."""
         for field, norm_field in PRECOMPUTED_NORMALIZATION_FIELDS.items():
-            setattr(self, norm_field, normalize_string(getattr(self, field, ""), field))
+            setattr(self, norm_field, self._normalized_value(field))
 
     def normalize_fields(self, fields=None):
         """Normalize all fields of the patient."""
         if fields is None:
             fields = NORMALIZED_FIELDS
+            self.fields_normalized = True
         for field, norm_field in fields.items():
-            setattr(self, norm_field, normalize_string(getattr(self, field, ""), field))
+            setattr(self, norm_field, self._normalized_value(field))
+
+    def _normalized_value(self, field):
+        """
+        Return the normalized value of a field, interned so that equal values
+        across patients share one object and compare by identity.
+
+        normalize_string is applied twice: address normalization is not
+        idempotent, and the scorer has always compared the twice-normalized
+        values. Doing both passes here keeps those values at one cost per patient.
+        """
+        once = normalize_string(getattr(self, field, ""), field)
+        return sys.intern(normalize_string(once, field))
+
+    def ensure_normalized(self):
+        """Normalize all fields on first use; later calls are no-ops."""
+        if not self.fields_normalized:
+            self.normalize_fields()
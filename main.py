@@ -1,10 +1,17 @@
 import logging
+import os
 import webbrowser
 import threading
 from flask import Flask, render_template, request, jsonify
 from app.matching.matcher import match_patients
 from app.io.csv_io import load_data, write_match, create_output_files, write_all_matches
-from app.config import DEBUG, PORT, LOG_LEVEL
+from app.config import (
+    DEBUG,
+    PORT,
+    LOG_LEVEL,
+    INTERNAL_CSV_PATH,
+    EXTERNAL_CSV_PATH,
+)
 from app.filters import register_filters
 from app.models.match_output import MatchOutput
 
@@ -21,6 +28,20 @@ PATIENT_FIELDS = [
     "zipcode",
 ]
 
+# Sorted matches from the last run, keyed on the input CSV modification times
+_match_cache = {"key": None, "matches": None}
+
+
+def _input_files_version():
+    """Return the input CSV modification times, or None if either is missing."""
+    try:
+        return (
+            os.stat(INTERNAL_CSV_PATH).st_mtime_ns,
+            os.stat(EXTERNAL_CSV_PATH).st_mtime_ns,
+        )
+    except OSError:
+        return None
+
 
 def create_app() -> Flask:
     """Create and configure the Flask application."""
@@ -29,11 +50,20 @@ def create_app() -> Flask:
     register_filters(flask_app)
 
     create_output_files()
+    # matches.csv was just truncated, so the next index request must rewrite it
+    _match_cache.update(key=None, matches=None)
 
     @flask_app.route("/")
     def index():
         """Render the main index page with patient matches."""
         try:
+            key = _input_files_version()
+            if key is not None and _match_cache["key"] == key:
+                return render_template(
+                    "index.html",
+                    matches=_match_cache["matches"],
+                    patient_fields=PATIENT_FIELDS,
+                )
             internal, external = load_data()
             if not internal or not external:
                 return render_template(
@@ -48,6 +78,7 @@ def create_app() -> Flask:
                 reverse=False,
             )
             write_all_matches(matches)
+            _match_cache.update(key=key, matches=matches)
             return render_template(
                 "index.html", matches=matches, patient_fields=PATIENT_FIELDS
             )
@@ -77,8 +108,6 @@ def open_browser():
 
 
 if __name__ == "__main__":
-    import os
-
     if os.environ.get("WERKZEUG_RUN_MAIN") != "true":
         threading.Timer(1.0, open_browser).start()
     app.run(debug=DEBUG, port=PORT)
@@ -2,10 +2,17 @@
 Unit tests for CSV IO functions, including loading patient data from CSV files.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from app.io import csv_io
 from app.models.patient import Patient
+from app.models.match_output import MatchOutput
+from app.models.match_result import MatchResult
+
+# Disable protected member access warnings for test methods
+# pylint: disable=protected-access
 
 
 def get_fake_patients():
@@ -69,6 +76,94 @@ class TestCsvIo(unittest.TestCase):
         self.assertEqual(internal, [])
         self.assertEqual(external, [])
 
+    def test_load_patients_reads_columns_by_header(self):
+        """Test that load_patients maps columns by header, skipping blanks and padding short rows."""
+        content = (
+            "ZipCode,City,Address,PhoneNumber,Sex,DOB,LastName,FirstName,InternalPatientId\n"
+            "12345,Metropolis,123 Main St,1234567890,M,1990-01-01,Doe,John,1\n"
+            "\n"
+            "54321,Gotham,456 Elm St,0987654321,F,1985-05-05,Smith,Jane,2\n"
+            "99999,Smallville,1 Oak St,5550000000,M,1970-07-07,Kent,Clark\n"
+        )
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8", newline=""
+        ) as f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+
+        patients = csv_io.load_patients(f.name, "InternalPatientId")
+
+        self.assertEqual(patients[:2], self.fake_patients)
+        # A short row is padded rather than rejected; the missing id reads as None
+        self.assertEqual(
+            patients[2],
+            Patient(
+                patient_id=None,
+                first_name="Clark",
+                last_name="Kent",
+                dob="1970-07-07",
+                sex="M",
+                phone_number="5550000000",
+                address="1 Oak St",
+                city="Smallville",
+                zipcode="99999",
+            ),
+        )
+
+    def test_load_patients_missing_file_returns_empty_list(self):
+        """Test that load_patients returns an empty list when the file cannot be read."""
+        self.assertEqual(
+            csv_io.load_patients("does/not/exist.csv", "InternalPatientId"), []
+        )
+
+    def test_write_match_appends_rows_through_shared_writer(self):
+        """Test that write_match appends each accepted match to the same open file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "accepted.csv")
+            writer = csv_io._AppendWriter(path)
+            self.addCleanup(writer.close)
+            with patch("app.io.csv_io._accepted_writer", writer):
+                self.assertTrue(csv_io.write_match(MatchOutput("EXT1", "INT1")))
+                self.assertTrue(csv_io.write_match(MatchOutput("EXT2", "INT2")))
+                with open(path, encoding="utf-8") as f:
+                    self.assertEqual(f.read().splitlines(), ["EXT1,INT1", "EXT2,INT2"])
+                writer.close()
+
+    def test_write_match_reopens_after_file_is_removed(self):
+        """Test that write_match writes to a fresh file once accepted.csv is deleted or rotated."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "accepted.csv")
+            writer = csv_io._AppendWriter(path)
+            self.addCleanup(writer.close)
+            with patch("app.io.csv_io._accepted_writer", writer):
+                self.assertTrue(csv_io.write_match(MatchOutput("EXT1", "INT1")))
+                os.replace(path, path + ".1")
+                self.assertTrue(csv_io.write_match(MatchOutput("EXT2", "INT2")))
+                writer.close()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read().splitlines(), ["EXT2,INT2"])
+
+    def test_write_match_returns_false_when_file_cannot_be_opened(self):
+        """Test that write_match reports failure instead of raising when the open fails."""
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = csv_io._AppendWriter(os.path.join(tmp, "missing", "accepted.csv"))
+            with patch("app.io.csv_io._accepted_writer", writer):
+                self.assertFalse(csv_io.write_match(MatchOutput("EXT1", "INT1")))
+
+    def test_write_all_matches_writes_header_and_rows(self):
+        """Test that write_all_matches overwrites matches.csv with one row per match."""
+        internal, external = get_fake_patients()
+        matches = [MatchResult(external=external, internal=internal, score=None)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "matches.csv")
+            with patch("app.io.csv_io.MATCHES_CSV_PATH", path):
+                csv_io.write_all_matches(matches)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(
+                    f.read().splitlines(),
+                    ["ExternalPatientId,InternalPatientId", "2,1"],
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from app.matching.field_similarity import (
     first_name_similarity,
     phone_similarity,
     general_similarity,
+    clear_similarity_cache,
 )
 
 
@@ -218,6 +219,17 @@ class TestFieldSimilarity(unittest.TestCase):
         self.assertEqual(result.algorithm, "levenshtein (general)")
         self.assertEqual(result.similarity, 0.0)
 
+    def test_calculate_field_similarity_is_memoized(self):
+        """Test that repeated comparisons reuse the cached result until the cache is cleared."""
+        clear_similarity_cache()
+        first = calculate_field_similarity("Smith", "Smyth", "name", "last_name")
+        second = calculate_field_similarity("Smith", "Smyth", "name", "last_name")
+        self.assertIs(first, second)
+        clear_similarity_cache()
+        third = calculate_field_similarity("Smith", "Smyth", "name", "last_name")
+        self.assertIsNot(first, third)
+        self.assertEqual(first, third)
+
 
 if __name__ == "__main__":
     unittest.main()
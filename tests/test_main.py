@@ -1,10 +1,14 @@
 import unittest
 from unittest.mock import patch
+import main
 from main import PATIENT_FIELDS, app
 from app.models.match_result import MatchResult
 from app.models.patient import Patient
 from app.models.match_score import MatchScore
 
+# Disable protected member access warnings for test methods
+# pylint: disable=protected-access
+
 
 class TestMain(unittest.TestCase):
     """
@@ -24,6 +28,7 @@ class TestMain(unittest.TestCase):
         """
         app.config["TESTING"] = True
         self.client = app.test_client()
+        main._match_cache.update(key=None, matches=None)
 
     @patch("main.load_data")
     @patch("main.render_template")
@@ -98,6 +103,41 @@ class TestMain(unittest.TestCase):
         mock_write_all_matches.assert_called_with(sorted_matches)
         self.assertEqual(response.data, b"matches rendered")
 
+    @patch("main._input_files_version", return_value=(1, 2))
+    @patch("main.load_data")
+    @patch("main.match_patients")
+    @patch("main.write_all_matches")
+    @patch("main.render_template")
+    def test_index_reuses_cached_matches(
+        self,
+        mock_render_template,
+        mock_write_all_matches,
+        mock_match_patients,
+        mock_load_data,
+        mock_version,
+    ):
+        """
+        Test that the index route reuses the previous matches while the input files are unchanged.
+
+        This test verifies that a second request with the same input file version does not
+        reload or rematch the data, and that a changed version triggers a fresh match run.
+        """
+        mock_load_data.return_value = ([{"patient_id": 1}], [{"patient_id": 2}])
+        mock_match_patients.return_value = []
+        mock_render_template.return_value = "matches rendered"
+        self.client.get("/")
+        self.client.get("/")
+        self.assertEqual(mock_load_data.call_count, 1)
+        self.assertEqual(mock_match_patients.call_count, 1)
+        self.assertEqual(mock_write_all_matches.call_count, 1)
+        mock_render_template.assert_called_with(
+            "index.html", matches=[], patient_fields=PATIENT_FIELDS
+        )
+
+        mock_version.return_value = (1, 3)
+        self.client.get("/")
+        self.assertEqual(mock_load_data.call_count, 2)
+
     @patch("main.load_data", side_effect=IOError("file error"))
     @patch("main.render_template")
     def test_index_ioerror(
@@ -1,7 +1,6 @@
 import unittest
 from unittest.mock import patch
 from app.models.patient import Patient
-from app.models.match_score import MatchScore
 
 from app.matching.matcher import match_patients
 
@@ -37,15 +36,13 @@ class TestMatcher(unittest.TestCase):
         with patch(
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS", {"dob": "dob_norm"}
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ) as mock_calc_sim:
             p1 = DummyPatient(dob_norm="1990-01-01")
             p2 = DummyPatient(dob_norm="1990-01-01")
-            mock_calc_sim.return_value = MatchScore(
-                value=0.9,
-                breakdown={
-                    "dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}
-                },
+            mock_calc_sim.return_value = (
+                0.9,
+                {"dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}},
             )
 
             matches = match_patients([p1], [p2])
@@ -66,15 +63,13 @@ class TestMatcher(unittest.TestCase):
         with patch(
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS", {"dob": "dob_norm"}
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ) as mock_calc_sim:
             p1 = DummyPatient(dob_norm="1990-01-01")
             p2 = DummyPatient(dob_norm="2000-01-01")
-            mock_calc_sim.return_value = MatchScore(
-                value=0.95,
-                breakdown={
-                    "dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}
-                },
+            mock_calc_sim.return_value = (
+                0.95,
+                {"dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}},
             )
 
             matches = match_patients([p1], [p2])
@@ -85,15 +80,13 @@ class TestMatcher(unittest.TestCase):
         with patch(
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS", {"dob": "dob_norm"}
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ) as mock_calc_sim:
             p1 = DummyPatient(dob_norm="1990-01-01")
             p2 = DummyPatient(dob_norm="1990-01-01")
-            mock_calc_sim.return_value = MatchScore(
-                value=0.5,
-                breakdown={
-                    "dob": {"similarity": 0.5, "weight": 1.0, "weighted_score": 0.5}
-                },
+            mock_calc_sim.return_value = (
+                0.5,
+                {"dob": {"similarity": 0.5, "weight": 1.0, "weighted_score": 0.5}},
             )
 
             matches = match_patients([p1], [p2])
@@ -111,7 +104,7 @@ class TestMatcher(unittest.TestCase):
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS",
             {"dob": "dob_norm", "sex": "sex_norm"},
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.7), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ) as mock_calc_sim:
             # Use lowercased 'm' to match normalization of external patient
             p1 = DummyPatient(dob_norm="1990-01-01", sex_norm="m")
@@ -132,11 +125,11 @@ class TestMatcher(unittest.TestCase):
             ]
 
             # Simulate different similarity scores for each internal patient
-            def sim_func(_, internal):
+            def sim_func(_, internal, **_kwargs):
                 if internal is p1:
-                    return MatchScore(
-                        value=0.8,
-                        breakdown={
+                    return (
+                        0.8,
+                        {
                             "dob": {
                                 "similarity": 1.0,
                                 "weight": 1.0,
@@ -145,9 +138,9 @@ class TestMatcher(unittest.TestCase):
                         },
                     )
                 if internal is p2:
-                    return MatchScore(
-                        value=0.85,
-                        breakdown={
+                    return (
+                        0.85,
+                        {
                             "dob": {
                                 "similarity": 1.0,
                                 "weight": 1.0,
@@ -156,9 +149,9 @@ class TestMatcher(unittest.TestCase):
                         },
                     )  # best match
                 if internal is p3:
-                    return MatchScore(
-                        value=0.7,
-                        breakdown={
+                    return (
+                        0.7,
+                        {
                             "dob": {
                                 "similarity": 1.0,
                                 "weight": 1.0,
@@ -180,13 +173,47 @@ class TestMatcher(unittest.TestCase):
             self.assertIs(match.external, external[0])
             self.assertIs(match.internal, p2)
 
+    def test_match_patients_stops_at_perfect_score(self):
+        """Test match_patients stops scoring candidates once one scores 1.0."""
+        with patch(
+            "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS", {"dob": "dob_norm"}
+        ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
+            "app.matching.matcher.calculate_weighted_similarity_raw"
+        ) as mock_calc_sim:
+            p1 = DummyPatient(dob_norm="1990-01-01")
+            p2 = DummyPatient(dob_norm="1990-01-01")
+            p3 = DummyPatient(dob_norm="1990-01-01")
+            mock_calc_sim.side_effect = [
+                (0.9, {}),
+                (1.0, {}),
+            ]
+
+            matches = match_patients([p1, p2, p3], [p3])
+            self.assertEqual(mock_calc_sim.call_count, 2)
+            self.assertIs(matches[0].internal, p2)
+
+    def test_match_patients_prunes_below_threshold(self):
+        """Test candidates are scored against the threshold and pruned ones are ignored."""
+        with patch(
+            "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS", {"dob": "dob_norm"}
+        ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
+            "app.matching.matcher.calculate_weighted_similarity_raw"
+        ) as mock_calc_sim:
+            p1 = DummyPatient(dob_norm="1990-01-01")
+            p2 = DummyPatient(dob_norm="1990-01-01")
+            mock_calc_sim.return_value = (0.4, None)
+
+            matches = match_patients([p1], [p2])
+            self.assertEqual(matches, [])
+            self.assertEqual(mock_calc_sim.call_args.kwargs["min_score"], 0.8)
+
     def test_match_patients_no_internal_patients(self):
         """Test match_patients returns empty list if internal list is empty."""
         with patch(
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS",
             {"dob": "dob_norm"},
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ):
             external = [
                 Patient(
@@ -210,7 +237,7 @@ class TestMatcher(unittest.TestCase):
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS",
             {"dob": "dob_norm"},
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ):
             internal = [
                 Patient(
@@ -234,15 +261,13 @@ class TestMatcher(unittest.TestCase):
             "app.matching.matcher.PRECOMPUTED_NORMALIZATION_FIELDS",
             {"dob": "dob_norm"},
         ), patch("app.matching.matcher.MATCH_THRESHOLD", 0.8), patch(
-            "app.matching.matcher.calculate_weighted_similarity"
+            "app.matching.matcher.calculate_weighted_similarity_raw"
         ) as mock_calc_sim:
             p1 = DummyPatient(dob_norm="1990-01-01")
             p2 = DummyPatient(dob_norm="1990-01-01")
-            mock_calc_sim.return_value = MatchScore(
-                value=0.9,
-                breakdown={
-                    "dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}
-                },
+            mock_calc_sim.return_value = (
+                0.9,
+                {"dob": {"similarity": 1.0, "weight": 1.0, "weighted_score": 1.0}},
             )
 
             match_patients([p1], [p2])
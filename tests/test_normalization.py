@@ -5,6 +5,7 @@ from app.matching.normalization import (
     normalize_date,
     normalize_string,
     extract_base_address,
+    standardize_address,
 )
 
 
@@ -74,6 +75,7 @@ class TestNormalization(unittest.TestCase):
         self.assertEqual(_normalize_phone("+1 (800) 555-0199"), "18005550199")
         self.assertEqual(_normalize_phone("ext. 1234"), "1234")
         self.assertEqual(_normalize_phone("abc-def-ghij"), "")
+        self.assertEqual(_normalize_phone("\u0663\u0664-5 \u00a0x6"), "\u0663\u066456")
 
     def test_normalize_address_abbreviations_and_typos(self):
         """Test _normalize_address with various abbreviations and typos."""
@@ -85,12 +87,25 @@ class TestNormalization(unittest.TestCase):
         self.assertEqual(_normalize_address("303 Court"), "303 ct")
         self.assertEqual(_normalize_address("404 Suite"), "404 ste")
 
+    def test_standardize_address(self):
+        """Test whole-word abbreviation replacement on mixed-case input."""
+        self.assertEqual(
+            standardize_address("12 North Main STREET Apartment 3"),
+            "12 n main st apt 3",
+        )
+        self.assertEqual(standardize_address("Streetside Lane"), "streetside ln")
+
     def test_normalize_string_general(self):
         """Test normalize_string with general strings and unknown field names."""
         self.assertEqual(
             normalize_string("  Hello,   World!  ", "unknown"), "hello world"
         )
         self.assertEqual(normalize_string("Test@String#123", "random"), "teststring123")
+        # Non-ASCII punctuation and whitespace are handled too
+        self.assertEqual(
+            normalize_string("Jos\u00e9\u2019s\u3000Caf\u00e9!", "unknown"),
+            "jos\u00e9s caf\u00e9",
+        )
         self.assertEqual(normalize_string("", "address"), "")
         self.assertEqual(normalize_string("APT 5", "address"), "apt 5")
 
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch
 from app.models.patient import Patient
+from app.matching.normalization import normalize_string
 
 
 class DummyNormalizer:
@@ -13,15 +14,17 @@ class DummyNormalizer:
     def normalize_string(value, field):
         """
         Simulate normalization by returning a string indicating the field and value.
+        Already-normalized values are returned unchanged, as with a real normalizer.
         """
-        return f"normalized_{field}_{value}"
+        prefix = f"normalized_{field}_"
+        return value if value.startswith(prefix) else prefix + value
 
 
 PRECOMPUTED_NORMALIZATION_FIELDS = {
-    "first_name": "normalized_first_name",
-    "last_name": "normalized_last_name",
+    "first_name": "first_name_norm",
+    "last_name": "last_name_norm",
 }
-NORMALIZED_FIELDS = {"address": "normalized_address", "city": "normalized_city"}
+NORMALIZED_FIELDS = {"address": "address_norm", "city": "city_norm"}
 
 
 class TestPatient(unittest.TestCase):
@@ -91,13 +94,13 @@ class TestPatient(unittest.TestCase):
             zipcode="54321",
         )
         patient.normalize_precomputed_fields()
-        self.assertTrue(hasattr(patient, "normalized_first_name"))
-        self.assertTrue(hasattr(patient, "normalized_last_name"))
+        self.assertTrue(hasattr(patient, "first_name_norm"))
+        self.assertTrue(hasattr(patient, "last_name_norm"))
         self.assertEqual(
-            getattr(patient, "normalized_first_name"), "normalized_first_name_Alice"
+            getattr(patient, "first_name_norm"), "normalized_first_name_Alice"
         )
         self.assertEqual(
-            getattr(patient, "normalized_last_name"), "normalized_last_name_Smith"
+            getattr(patient, "last_name_norm"), "normalized_last_name_Smith"
         )
 
     def test_normalize_fields(self):
@@ -116,14 +119,56 @@ class TestPatient(unittest.TestCase):
             zipcode="67890",
         )
         patient.normalize_fields()
-        self.assertTrue(hasattr(patient, "normalized_address"))
-        self.assertTrue(hasattr(patient, "normalized_city"))
+        self.assertTrue(hasattr(patient, "address_norm"))
+        self.assertTrue(hasattr(patient, "city_norm"))
         self.assertEqual(
-            getattr(patient, "normalized_address"), "normalized_address_789 Oak Ave"
+            getattr(patient, "address_norm"), "normalized_address_789 Oak Ave"
         )
-        self.assertEqual(
-            getattr(patient, "normalized_city"), "normalized_city_Star City"
+        self.assertEqual(getattr(patient, "city_norm"), "normalized_city_Star City")
+
+    def test_ensure_normalized_runs_once(self):
+        """
+        Test that ensure_normalized attaches normalized fields on first use and is a no-op afterwards.
+        """
+        patient = Patient(
+            patient_id="3",
+            first_name="Carol",
+            last_name="White",
+            dob="1980-02-02",
+            sex="F",
+            phone_number="555-0000",
+            address="1 Pine Rd",
+            city="Central City",
+            zipcode="11111",
+        )
+        self.assertFalse(patient.fields_normalized)
+        patient.ensure_normalized()
+        self.assertTrue(patient.fields_normalized)
+        self.assertEqual(getattr(patient, "city_norm"), "normalized_city_Central City")
+        patient.city = "Gotham"
+        patient.ensure_normalized()
+        self.assertEqual(getattr(patient, "city_norm"), "normalized_city_Central City")
+
+    def test_normalized_value_applies_normalize_string_twice(self):
+        """
+        Test that normalized attributes hold the twice-normalized value the scorer compares.
+        """
+        patient = Patient(
+            patient_id="4",
+            first_name="Dan",
+            last_name="Green",
+            dob="1975-03-03",
+            sex="M",
+            phone_number="555-1111",
+            address=", 0012 North",
+            city="Coast City",
+            zipcode="22222",
         )
+        with patch("app.models.patient.normalize_string", normalize_string):
+            patient.normalize_fields()
+        # A single pass leaves "0012 n"; the second strips the leading zeros
+        self.assertEqual(normalize_string(", 0012 North", "address"), "0012 n")
+        self.assertEqual(getattr(patient, "address_norm"), "12 n")
 
 
 if __name__ == "__main__":
@@ -69,9 +69,18 @@ class TestScoring(unittest.TestCase):
             "last_name": "last_name_norm",
             "dob": "dob_norm",
         }
-        patcher1 = patch("app.matching.scoring.FIELD_WEIGHTS", self.field_weights)
-        patcher2 = patch("app.matching.scoring.FIELD_TYPES", self.field_types)
-        patcher4 = patch("app.matching.scoring.CRITICAL_FIELDS", self.critical_fields)
+        patcher1 = patch(
+            "app.matching.scoring._FIELD_SPEC",
+            scoring._build_field_spec(
+                self.field_weights,
+                self.field_types,
+                self.normalized_fields,
+                self.critical_fields,
+            ),
+        )
+        patcher2 = patch(
+            "app.matching.scoring._TOTAL_WEIGHT", sum(self.field_weights.values())
+        )
         patcher5 = patch(
             "app.matching.scoring.NORMALIZED_FIELDS", self.normalized_fields
         )
@@ -79,7 +88,6 @@ class TestScoring(unittest.TestCase):
         self.patchers = [
             patcher1,
             patcher2,
-            patcher4,
             patcher5,
             patcher7,
         ]
@@ -87,7 +95,7 @@ class TestScoring(unittest.TestCase):
             p.start()
         self.addCleanup(lambda: [p.stop() for p in self.patchers])
 
-    @patch("app.matching.scoring.calculate_field_similarity")
+    @patch("app.matching.scoring.calculate_normalized_field_similarity")
     def test_all_fields_partial_match(self, mock_sim):
         """
         Test that partial similarity across all fields results in a score between 0 and 1,
@@ -108,7 +116,7 @@ class TestScoring(unittest.TestCase):
         self.assertTrue(0 < score.value < 1)
         self.assertEqual(len(score.breakdown), 3)
 
-    @patch("app.matching.scoring.calculate_field_similarity")
+    @patch("app.matching.scoring.calculate_normalized_field_similarity")
     def test_no_fields_match(self, mock_sim):
         """
         Test that when all similarities are zero, the score is zero and early_exit is set in details.
@@ -119,7 +127,7 @@ class TestScoring(unittest.TestCase):
         score = scoring.calculate_weighted_similarity(p1, p2)
         self.assertEqual(score.value, 0.0)
 
-    @patch("app.matching.scoring.calculate_field_similarity")
+    @patch("app.matching.scoring.calculate_normalized_field_similarity")
     def test_missing_fields_in_one_patient(self, mock_sim):
         """
         Test that missing fields in one patient are handled correctly in the breakdown.
@@ -138,15 +146,28 @@ class TestScoring(unittest.TestCase):
         # The test expects last_name similarity to be 0.5 for missing field
         self.assertEqual(score.breakdown["last_name"]["similarity"], 0.5)
 
-    def test__get_normalized_precompute_values_missing_norm(self):
+    @patch("app.matching.scoring.calculate_normalized_field_similarity")
+    def test_raw_score_prunes_below_min_score(self, mock_sim):
+        """
+        Test that scoring stops once the remaining fields cannot lift the score above min_score.
+        """
+        mock_sim.return_value = FieldSimilarityResult(0.0, "alg")
+        p1 = DummyPatient(first_name_norm="A", last_name_norm="B", dob_norm="C")
+        p2 = DummyPatient(first_name_norm="X", last_name_norm="Y", dob_norm="Z")
+        value, breakdown = scoring.calculate_weighted_similarity_raw(
+            p1, p2, min_score=0.9
+        )
+        self.assertIsNone(breakdown)
+        self.assertEqual(mock_sim.call_count, 1)
+        # first_name (weight 2 of 7) scored 0.0; the rest could add at most 5/7
+        self.assertAlmostEqual(value, 5.0 / 7.0)
+
+    def test__build_field_spec_missing_norm(self):
         """
-        Test that _get_normalized_precompute_values falls back to field_name_norm if not in NORMALIZED_FIELDS.
+        Test that _build_field_spec falls back to field_name_norm if not in NORMALIZED_FIELDS.
         """
-        p1 = DummyPatient(sex_norm="bar")
-        p2 = DummyPatient(sex_norm="baz")
-        n1, n2 = scoring._get_normalized_precompute_values(p1, p2, "sex")
-        self.assertEqual(n1, "bar")
-        self.assertEqual(n2, "baz")
+        spec = scoring._build_field_spec({"sex": 1.0}, {}, {}, set())
+        self.assertEqual(spec, (("sex", 1.0, "general", "sex_norm", False),))
 
     def test__update_breakdown_and_score_zero_weight(self):
         """
@@ -159,17 +180,17 @@ class TestScoring(unittest.TestCase):
 
     def test_final_score_zero_weight(self):
         """
-        Test that when FIELD_WEIGHTS is empty, the final score defaults to DEFAULT_SIMILARITY.
+        Test that when no field weights are configured, the final score defaults to DEFAULT_SIMILARITY.
         This ensures the scoring system has a fallback when no field weights are configured.
         """
 
-        orig_field_weights = scoring.FIELD_WEIGHTS
-        scoring.FIELD_WEIGHTS = {}
+        orig_field_spec = scoring._FIELD_SPEC
+        scoring._FIELD_SPEC = scoring._build_field_spec({}, {}, {}, set())
         p1 = DummyPatient()
         p2 = DummyPatient()
         score = scoring.calculate_weighted_similarity(p1, p2)
         self.assertEqual(score.value, scoring.DEFAULT_SIMILARITY)
-        scoring.FIELD_WEIGHTS = orig_field_weights
+        scoring._FIELD_SPEC = orig_field_spec
 
     def test_final_score_below_default(self):
         """
@@ -177,10 +198,10 @@ class TestScoring(unittest.TestCase):
         the final score is set to DEFAULT_SIMILARITY as a minimum threshold.
         This ensures the scoring system maintains a baseline similarity score.
         """
-        orig_field_weights = scoring.FIELD_WEIGHTS
-        orig_critical_fields = scoring.CRITICAL_FIELDS
-        scoring.FIELD_WEIGHTS = {"test_field": 1.0}
-        scoring.CRITICAL_FIELDS = set()
+        orig_field_spec = scoring._FIELD_SPEC
+        scoring._FIELD_SPEC = scoring._build_field_spec(
+            {"test_field": 1.0}, {}, {}, set()
+        )
 
         class P(DummyPatient):
             """
@@ -194,8 +215,7 @@ class TestScoring(unittest.TestCase):
         score = scoring.calculate_weighted_similarity(p1, p2)
         # The expected score is 0.5, since both normalized values are empty and not critical, so sim=0.5
         self.assertEqual(score.value, 0.5)
-        scoring.FIELD_WEIGHTS = orig_field_weights
-        scoring.CRITICAL_FIELDS = orig_critical_fields
+        scoring._FIELD_SPEC = orig_field_spec
 
     def test_penalize_missing_critical_field(self):
         """
@@ -229,7 +249,9 @@ class TestScoring(unittest.TestCase):
         """
         Test that the breakdown for each field contains the algorithm used.
         """
-        with patch("app.matching.scoring.calculate_field_similarity") as mock_sim:
+        with patch(
+            "app.matching.scoring.calculate_normalized_field_similarity"
+        ) as mock_sim:
             mock_sim.return_value = FieldSimilarityResult(1.0, "dummy_alg")
             p1 = DummyPatient(first_name_norm="A", last_name_norm="B", dob_norm="C")
             p2 = DummyPatient(first_name_norm="A", last_name_norm="B", dob_norm="C")
@@ -242,7 +264,9 @@ class TestScoring(unittest.TestCase):
         """
         Test that the weighted score for each field is calculated as similarity * weight.
         """
-        with patch("app.matching.scoring.calculate_field_similarity") as mock_sim:
+        with patch(
+            "app.matching.scoring.calculate_normalized_field_similarity"
+        ) as mock_sim:
             mock_sim.side_effect = [
                 FieldSimilarityResult(0.5, "alg1"),
                 FieldSimilarityResult(0.7, "alg2"),
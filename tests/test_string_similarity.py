@@ -20,6 +20,42 @@ class TestStringSimilarityMetrics(unittest.TestCase):
         self.assertEqual(string_similarity.levenshtein_similarity("", "abc"), 0.0)
         self.assertEqual(string_similarity.levenshtein_similarity("abc", "abc"), 1.0)
 
+    def test_levenshtein_distance_kernels_agree(self):
+        """Test the bit-parallel and row DP Levenshtein kernels give the same distances."""
+        pairs = [
+            ("kitten", "sitting", 3),
+            ("flaw", "lawn", 2),
+            ("main", "mian", 2),
+            ("springfield", "springfeld", 1),
+            ("a" * 70, "a" * 68 + "bc", 2),
+        ]
+        for a, b, expected in pairs:
+            self.assertEqual(string_similarity.levenshtein_distance(a, b), expected)
+            self.assertEqual(string_similarity._levenshtein_dp(a, b, len(b)), expected)
+            self.assertEqual(
+                string_similarity._levenshtein_bit_parallel(a, b, len(b)), expected
+            )
+
+    def test_levenshtein_distance_bounded(self):
+        """Test that a bounded distance is exact within the bound and max_distance + 1 past it."""
+        self.assertEqual(
+            string_similarity.levenshtein_distance("kitten", "sitting", 3), 3
+        )
+        self.assertEqual(
+            string_similarity.levenshtein_distance("kitten", "sitting", 2), 3
+        )
+        self.assertEqual(string_similarity.levenshtein_distance("ab", "abcdef", 1), 2)
+        long_a, long_b = "a" * 80, "b" * 80
+        self.assertEqual(string_similarity.levenshtein_distance(long_a, long_b, 5), 6)
+        # Long DP path where the last row stays within the bound but the result does not
+        shifted_a, shifted_b = "c" * 10 + "a" * 60, "a" * 60 + "d" * 10
+        self.assertEqual(
+            string_similarity.levenshtein_distance(shifted_a, shifted_b, 15), 16
+        )
+        self.assertEqual(
+            string_similarity.levenshtein_distance(shifted_a, shifted_b, 20), 20
+        )
+
     def test_jaccard_similarity(self):
         """Test Jaccard (token overlap) similarity calculation."""
         self.assertEqual(
@@ -23,6 +23,17 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.get_patient_id(p3), "GEN-1")
         self.assertEqual(utils.get_patient_id(p4), utils.FALLBACK_PATIENT_ID)
 
+    def test_log_elapsed_time_logs_milliseconds(self):
+        """Test that log_elapsed_time returns the result and logs elapsed milliseconds."""
+
+        @utils.log_elapsed_time
+        def work(x):
+            return x * 2
+
+        with self.assertLogs(level="INFO") as logs:
+            self.assertEqual(work(21), 42)
+        self.assertRegex(logs.output[0], r"work completed in \d+\.\d{3} ms\.")
+
 
 if __name__ == "__main__":
     unittest.main()